@@ -13,6 +13,7 @@ Functionality:
 Dependencies:
 - `os` for environment variable management.
 - `supabase` Python client for interacting with Supabase.
+- `asyncio` for running the blocking Supabase client calls concurrently in worker threads.
 - `dotenv` for loading environment variables from a `.env` file.
 
 Usage:
@@ -23,7 +24,8 @@ Usage:
 3. Run the script to delete all files in the specified folder.
 
 Functions:
-- `delete_folder(bucket_name, folder_name)`: Deletes all files in the specified folder within a Supabase storage bucket.
+- `delete_folder(bucket_name, folder_name, chunk_size, concurrency)`: Deletes all files in the specified folder
+  within a Supabase storage bucket, removing them in concurrent fixed-size chunks.
 
 Example:
     $ python delete_folder.py
@@ -32,53 +34,124 @@ Example:
     All files in folder 'bucket_folder_name' have been deleted.
 """
 
+import asyncio
+import logging
 import os
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
+# Shared HTTP client with a connection pool sized for concurrent requests. The
+# SDK uses an injected client as-is, so its timeout must cover large listings.
+_HTTP = httpx.Client(
+    limits=httpx.Limits(max_connections=120, max_keepalive_connections=80, keepalive_expiry=30),
+    timeout=httpx.Timeout(120),
+)
+
 # Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+supabase: Client = create_client(
+    SUPABASE_URL, SUPABASE_KEY, options=ClientOptions(httpx_client=_HTTP)
+)
+
+
+async def _delete_chunk(sem, bucket_name, chunk):
+    """
+    Delete a single chunk of files, running the blocking client call in a worker thread.
+
+    Args:
+        sem (asyncio.Semaphore): Semaphore bounding the number of in-flight requests.
+        bucket_name (str): The name of the Supabase storage bucket.
+        chunk (list): File paths to delete.
+
+    Returns:
+        list: The objects removed by the delete request.
+    """
+    async with sem:
+        return await asyncio.to_thread(supabase.storage.from_(bucket_name).remove, chunk)
 
 
-def delete_folder(bucket_name, folder_name):
+async def _list_and_delete(bucket_name, folder_name, chunk_size, concurrency):
+    """
+    List a folder and delete its files in chunks dispatched concurrently.
+
+    Args:
+        bucket_name (str): The name of the Supabase storage bucket.
+        folder_name (str): The folder path inside the bucket to delete.
+        chunk_size (int): Number of files removed per delete request.
+        concurrency (int): Maximum number of delete requests in flight at once.
+
+    Returns:
+        list: Pairs of each chunk and its delete result, or the raised exception.
+        None if the folder is empty, does not exist, or could not be listed.
+    """
+    # List all files in the folder
+    response = await asyncio.to_thread(
+        supabase.storage.from_(bucket_name).list, folder_name, {"limit": 10000}
+    )
+    logger.debug("Listed folder '%s': %s", folder_name, response)
+    # Check if the response is valid
+    if not response or not isinstance(response, list):
+        return None
+
+    file_path_list = [f"{folder_name}/{file['name']}" for file in response]
+    chunks = [
+        file_path_list[i : i + chunk_size] for i in range(0, len(file_path_list), chunk_size)
+    ]
+
+    sem = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(
+        *[_delete_chunk(sem, bucket_name, chunk) for chunk in chunks],
+        return_exceptions=True,
+    )
+    return list(zip(chunks, results))
+
+
+def delete_folder(bucket_name, folder_name, chunk_size=500, concurrency=8):
     """
     Deletes all files in a specified folder within a Supabase storage bucket.
 
     Args:
         bucket_name (str): The name of the Supabase storage bucket.
         folder_name (str): The folder path inside the bucket to delete.
+        chunk_size (int): Number of files removed per delete request.
+        concurrency (int): Maximum number of delete requests in flight at once.
     """
-    # Initialize response
-    response = None
     try:
-        # List all files in the folder
-        response = supabase.storage.from_(bucket_name).list(folder_name, {"limit": 10000})
-        print(response)
-        # Check if the response is valid
-        if not response or not isinstance(response, list):
-            print(f"Folder '{folder_name}' is empty, does not exist, or an error occurred.")
+        results = asyncio.run(_list_and_delete(bucket_name, folder_name, chunk_size, concurrency))
+        if results is None:
+            logger.warning(
+                "Folder '%s' is empty, does not exist, or an error occurred.", folder_name
+            )
             return
 
-        file_path_list = [f"{folder_name}/{file['name']}" for file in response]
-
-        delete_response = supabase.storage.from_(bucket_name).remove(file_path_list)
+        failed = []
+        for chunk, result in results:
+            if isinstance(result, Exception):
+                logger.error("Failed to delete: %s (%s)", chunk, result)
+                failed.extend(chunk)
+            else:
+                logger.info("Deleted: %s", chunk)
 
-        if delete_response["httpStatusCode"] == 200:
-            print(f"Deleted: {file_path_list}")
+        if failed:
+            logger.error("%d files in folder '%s' could not be deleted.", len(failed), folder_name)
         else:
-            print(f"Failed to delete: {file_path_list}")
-
-        print(f"All files in folder '{folder_name}' have been deleted.")
+            logger.info("All files in folder '%s' have been deleted.", folder_name)
     except Exception as e:
-        print(f"An error occurred while deleting folder '{folder_name}': {e}")
+        logger.error("An error occurred while deleting folder '%s': %s", folder_name, e)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # httpx logs every request at INFO; keep the output to the deletion summary
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     bucket_name = "bucket_name"
     folder_name = "bucket_folder_name"
 
@@ -11,123 +11,611 @@ Key Features:
 - Includes detailed logging and error handling for improved user feedback.
 """
 
+import asyncio
+import itertools
 import json
+import logging
+import logging.handlers
 import os
-import csv
-from supabase import create_client, Client
+import pickle
+import sys
+import tempfile
+import time
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+import aiofiles
+import httpx
+import pandas as pd
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
+# Directory holding cached bucket listings between runs
+CACHE_DIR = ".cache"
+
+# Number of processed uploads between progress log lines
+PROGRESS_INTERVAL = 1000
+
+# Connection pool limits sized for concurrent requests
+_LIMITS = httpx.Limits(max_connections=120, max_keepalive_connections=80, keepalive_expiry=30)
+
+# Shared HTTP client with a connection pool sized for concurrent requests. The
+# SDK uses an injected client as-is, so its timeout must cover large deletes.
+_HTTP = httpx.Client(limits=_LIMITS, timeout=httpx.Timeout(120))
+
 # Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+supabase: Client = create_client(
+    SUPABASE_URL, SUPABASE_KEY, options=ClientOptions(httpx_client=_HTTP)
+)
 
 
-def fetch_file_list_from_bucket(bucket, bucket_dir, limit=10000):
+def _is_transient(exc):
     """
-    Fetch the list of files in a specific Supabase storage bucket directory.
+    Check whether an exception is worth retrying.
+
+    Args:
+        exc (BaseException): The exception raised by a request.
+
+    Returns:
+        bool: True for network failures and 429 or 5xx responses, False otherwise.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError))
+
+
+_backoff = wait_exponential_jitter(1, 30)
+
+
+def _wait_retry_after(retry_state):
+    """
+    Wait for the `Retry-After` of a 429 response, falling back to exponential jitter.
+
+    Args:
+        retry_state (tenacity.RetryCallState): State of the failed attempt.
+
+    Returns:
+        float: Number of seconds to wait before the next attempt.
+    """
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+        retry_after = exc.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return int(retry_after)
+    return _backoff(retry_state)
+
+
+# Retry policy for transient network failures, 429 and 5xx responses
+_retry_transient = retry(
+    wait=_wait_retry_after,
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+
+
+def _raise_for_transient_status(response):
+    """
+    Raise for responses that are worth retrying.
 
     Args:
+        response (httpx.Response): The response to check.
+
+    Raises:
+        httpx.HTTPStatusError: If the response status is 429 or 5xx.
+    """
+    if response.status_code == 429 or response.status_code >= 500:
+        response.raise_for_status()
+
+
+def _async_client(headers=None):
+    """
+    Build an HTTP/2 client for the Supabase storage REST API.
+
+    Requests made through the client are multiplexed over shared connections,
+    so concurrent calls do not each pay for a TCP and TLS handshake.
+
+    Args:
+        headers (dict): Extra headers sent with every request.
+
+    Returns:
+        httpx.AsyncClient: The configured client.
+    """
+    return httpx.AsyncClient(
+        http2=True, limits=_LIMITS, timeout=60, headers={**_auth_headers(), **(headers or {})}
+    )
+
+
+def _auth_headers():
+    """
+    Build the authentication headers required by the Supabase storage REST API.
+
+    Returns:
+        dict: Headers carrying the API key.
+    """
+    return {"apikey": SUPABASE_KEY, "Authorization": f"Bearer {SUPABASE_KEY}"}
+
+
+@_retry_transient
+async def _fetch_page(client, bucket, bucket_dir, limit, offset):
+    """
+    Fetch a single page of a Supabase storage bucket directory listing.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client used for the request.
         bucket (str): The name of the bucket.
         bucket_dir (str): The directory path inside the bucket.
         limit (int): Maximum number of files to fetch.
+        offset (int): Offset of the first file in the page.
 
     Returns:
-        set: A set containing filenames from the specified bucket directory.
+        list: The file objects returned for the page.
     """
-    try:
-        available_files = set()
-        zero_byte_files = set()
-        offset = 0
+    url = f"{SUPABASE_URL}/storage/v1/object/list/{bucket}"
+    body = {
+        "prefix": bucket_dir,
+        "limit": limit,
+        "offset": offset,
+        "sortBy": {"column": "name", "order": "asc"},
+    }
+    response = await client.post(url, json=body)
+    _raise_for_transient_status(response)
+    response.raise_for_status()
+    return response.json()
+
+
+async def _fetch_file_list_from_bucket_async(bucket, bucket_dir, limit, window):
+    """
+    Fetch a bucket directory listing, requesting `window` pages concurrently at a time.
+
+    Args:
+        bucket (str): The name of the bucket.
+        bucket_dir (str): The directory path inside the bucket.
+        limit (int): Maximum number of files to fetch per page.
+        window (int): Number of pages requested concurrently.
+
+    Returns:
+        tuple: The set of all filenames and the set of zero-byte filenames.
+    """
+    available_files = set()
+    zero_byte_files = set()
+    base = 0
+
+    async with _async_client() as client:
         while True:
-            response = supabase.storage.from_(bucket).list(
-                bucket_dir, {"limit": limit, "offset": offset}
-            )
-            if not response:
-                print(f"Stopping fetch: No more files found.")
+            offsets = [base + i * limit for i in range(window)]
+            tasks = [
+                asyncio.create_task(_fetch_page(client, bucket, bucket_dir, limit, offset))
+                for offset in offsets
+            ]
+            try:
+                pages = await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop the rest of the window before the client closes under it
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            done = False
+            for offset, response in zip(offsets, pages):
+                # Check file sizes and add zero-byte files
+                for item in response:
+                    if item.get("metadata") and item.get("metadata").get("size", 0) == 0:
+                        zero_byte_files.add(item.get("name", ""))
+                    available_files.add(item.get("name", ""))
+
+                if response:
+                    logger.info("Fetched %d files (offset: %d).", len(response), offset)
+
+                # Stop if fewer files than the limit were returned (end of results)
+                if len(response) < limit:
+                    done = True
+
+            if done:
+                logger.info("Stopping fetch: No more files found.")
                 break
 
-            # Check file sizes and add zero-byte files
-            for item in response:
-                if item.get("metadata") and item.get("metadata").get("size", 0) == 0:
-                    zero_byte_files.add(item.get("name", ""))
-                available_files.add(item.get("name", ""))
+            # Move the window to the next batch of pages
+            base += window * limit
 
-            print(f"Fetched {len(response)} files (offset: {offset}).")
+    return available_files, zero_byte_files
 
-            # Stop if fewer files than the limit were returned (end of results)
-            if len(response) < limit:
-                break
 
-            # Increment the offset for the next page
-            offset += limit
+def _cache_path(bucket, bucket_dir):
+    """
+    Build the path of the cached listing for a bucket directory.
+
+    Args:
+        bucket (str): The name of the bucket.
+        bucket_dir (str): The directory path inside the bucket.
+
+    Returns:
+        str: Path of the cache file, unique per bucket and directory.
+    """
+    return os.path.join(CACHE_DIR, f"{quote(f'{bucket}/{bucket_dir}', safe='')}.pkl")
+
+
+def clear_cached_file_list(bucket, bucket_dir):
+    """
+    Remove the cached listing for a bucket directory, if one exists.
+
+    Args:
+        bucket (str): The name of the bucket.
+        bucket_dir (str): The directory path inside the bucket.
+    """
+    try:
+        os.remove(_cache_path(bucket, bucket_dir))
+    except FileNotFoundError:
+        pass
+
+
+def _write_cached_file_list(cache_path, available_files, zero_byte_files):
+    """
+    Atomically write a bucket listing to the cache.
+
+    The listing is written to a temporary file first, so an interrupted run never
+    leaves a truncated cache behind with a fresh mtime.
 
-        print(f"Fetched a total of {len(available_files)} files from Supabase storage.")
-        return available_files, zero_byte_files
+    Args:
+        cache_path (str): Path of the cache file.
+        available_files (set): Set of all filenames in the bucket directory.
+        zero_byte_files (set): Set of filenames that have 0 byte size.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as cache_file:
+            pickle.dump((available_files, zero_byte_files), cache_file)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def fetch_file_list_from_bucket(
+    bucket, bucket_dir, limit=10000, window=8, refresh=False, cache_ttl=3600
+):
+    """
+    Fetch the list of files in a specific Supabase storage bucket directory.
+
+    The listing is cached on disk under `CACHE_DIR` and reused for `cache_ttl`
+    seconds unless `refresh` is set.
+
+    Args:
+        bucket (str): The name of the bucket.
+        bucket_dir (str): The directory path inside the bucket.
+        limit (int): Maximum number of files to fetch per page.
+        window (int): Number of pages requested concurrently.
+        refresh (bool): Ignore any cached listing and fetch it again.
+        cache_ttl (int): Number of seconds a cached listing stays valid.
+
+    Returns:
+        tuple: The set of all filenames and the set of zero-byte filenames in the
+        bucket directory, or (None, None) if the listing could not be fetched.
+    """
+    cache_path = _cache_path(bucket, bucket_dir)
+
+    if (
+        not refresh
+        and os.path.exists(cache_path)
+        and time.time() - os.path.getmtime(cache_path) < cache_ttl
+    ):
+        try:
+            with open(cache_path, "rb") as cache_file:
+                available_files, zero_byte_files = pickle.load(cache_file)
+            logger.info(
+                "Loaded %d files from cached listing '%s'.", len(available_files), cache_path
+            )
+            return available_files, zero_byte_files
+        except Exception as e:
+            logger.warning("Ignoring unreadable cached listing '%s': %s", cache_path, e)
+
+    try:
+        available_files, zero_byte_files = asyncio.run(
+            _fetch_file_list_from_bucket_async(bucket, bucket_dir, limit, window)
+        )
+        logger.info("Fetched a total of %d files from Supabase storage.", len(available_files))
 
     except Exception as e:
-        print(f"Error fetching files from bucket: {e}")
-        return set(), set()
+        logger.error("Error fetching files from bucket: %s", e)
+        return None, None
+
+    # A failed cache write must not discard a listing that was fetched successfully
+    try:
+        _write_cached_file_list(cache_path, available_files, zero_byte_files)
+    except OSError as e:
+        logger.warning("Could not write cached listing '%s': %s", cache_path, e)
+
+    return available_files, zero_byte_files
 
 
-def is_file_valid(file_name, file_list, zero_byte_list):
+async def _stream_bytes(path, chunk_size=64 * 1024):
     """
-    Check if a file exists in the fetched file list and is not in the list of zero byte files.
+    Stream the contents of a local file in fixed-size chunks.
 
     Args:
-        file_name (str): Name of the file to check.
-        file_list (set): Set of filenames fetched from the bucket.
-        zero_byte_list (set): Set of filenames that have 0 byte size.
+        path (str): Path to the local file.
+        chunk_size (int): Number of bytes to read per chunk.
+
+    Yields:
+        bytes: The next chunk of the file.
+    """
+    async with aiofiles.open(path, "rb") as file_data:
+        while True:
+            chunk = await file_data.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+@_retry_transient
+async def _post_file(client, url, path):
+    """
+    Stream a local file to the storage REST API, retrying transient failures.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client used for the upload.
+        url (str): Storage object URL to upload to.
+        path (str): Path to the local file.
 
     Returns:
-        bool: True if the file is valid (exists and is not zero-byte), False otherwise.
+        tuple: The HTTP status code and the response body text.
     """
+    # Stream the file so memory use stays at one chunk per upload
+    headers = {"Content-Length": str(os.path.getsize(path))}
 
-    return file_name in file_list and not file_name in zero_byte_list
+    response = await client.post(url, content=_stream_bytes(path), headers=headers)
+    _raise_for_transient_status(response)
+    return response.status_code, response.text
 
 
-def upload_missing_files(missing_files, directory_path, bucket, bucket_dir, file_extension):
+async def _upload_one(client, file_id, directory_path, bucket, bucket_dir, file_extension):
     """
-    Upload missing files to Supabase storage.
+    Upload a single file to Supabase storage through the storage REST API.
 
     Args:
-        missing_files (list): List of missing file names.
+        client (httpx.AsyncClient): Shared HTTP client used for the upload.
+        file_id (str): ID of the missing file.
         directory_path (str): Path to the local directory containing the files.
         bucket (str): Name of the Supabase bucket.
         bucket_dir (str): Directory path in the bucket to upload files to.
+        file_extension (str): Extension of the files to upload.
+
+    Returns:
+        bool: True if the file was uploaded, False otherwise.
     """
+    file_name = f"{file_id}.{file_extension}"
+    local_file_path = os.path.join(directory_path, file_name)
+
+    # Percent-encode each path segment, as the SDK's own upload does
+    url = f"{SUPABASE_URL}/storage/v1/object/{bucket}/{quote(f'{bucket_dir}/{file_name}')}"
+    try:
+        # Upload the file to the Supabase storage
+        status, text = await _post_file(client, url, local_file_path)
+        if status == 200:
+            logger.debug("Successfully uploaded: %s", file_name)
+            return True
+
+        # Attempt to parse the response content if it is JSON
+        try:
+            error_content = json.loads(text)
+            logger.error(
+                "Failed to upload %s: %s", file_name, error_content.get("error", "Unknown error")
+            )
+        except json.JSONDecodeError:
+            logger.error("Failed to upload %s. Response: %s", file_name, text)
+
+    except Exception as e:
+        logger.error("An error occurred while uploading %s: %s", file_name, e)
+
+    return False
+
+
+def _select_uploads(missing_files, directory_path, file_extension, valid_files):
+    """
+    Select the missing files that exist locally and are not already valid in the bucket.
+
+    Args:
+        missing_files (iterable): Missing file IDs, consumed lazily.
+        directory_path (str): Path to the local directory containing the files.
+        file_extension (str): Extension of the files to upload.
+        valid_files (set): Filenames already present and non-empty in the bucket.
+
+    Yields:
+        str: IDs of the files to upload.
+    """
+    # List the local directory once instead of stat-ing every missing file
+    with os.scandir(directory_path) as entries:
+        local_files = {entry.name for entry in entries if entry.is_file()}
+
     for file_id in missing_files:
         file_name = f"{file_id}.{file_extension}"
-        local_file_path = os.path.join(directory_path, file_name)
+        if file_name not in local_files:
+            logger.warning("File %s not found in local directory '%s'.", file_name, directory_path)
+        elif file_name not in valid_files:
+            yield file_id
 
-        # Check if the file exists in the local path
-        if os.path.exists(local_file_path):
-            try:
-                # Upload the file to the Supabase storage
-                with open(local_file_path, "rb") as file_data:
-                    response = supabase.storage.from_(bucket).upload(
-                        f"{bucket_dir}/{file_name}", file_data.read()
-                    )
 
-                if response.status_code == 200:
-                    print(f"Successfully uploaded: {file_name}")
-                else:
-                    # Attempt to parse the response content if it is JSON
-                    try:
-                        error_content = response.json()
-                        print(
-                            f"Failed to upload {file_name}: {error_content.get('error', 'Unknown error')}"
-                        )
-                    except json.JSONDecodeError:
-                        print(f"Failed to upload {file_name}. Response: {response.text}")
+def _flush_logs():
+    """
+    Flush the root logger's handlers so buffered progress reaches the terminal.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
 
-            except Exception as e:
-                print(f"An error occurred while uploading {file_name}: {e}")
-        else:
-            print(f"File {file_name} not found in local directory '{directory_path}'.")
+
+def _next_batch(iterator, size):
+    """
+    Take up to `size` items from an iterator, keeping the items read before any error.
+
+    Args:
+        iterator (iterator): The iterator to read from.
+        size (int): Maximum number of items to take.
+
+    Returns:
+        tuple: The items read and the exception raised by the iterator, or None.
+    """
+    batch = []
+    try:
+        for item in itertools.islice(iterator, size):
+            batch.append(item)
+    except Exception as e:
+        return batch, e
+    return batch, None
+
+
+async def _upload_missing_files_async(
+    missing_files, directory_path, bucket, bucket_dir, file_extension, concurrency, valid_files
+):
+    """
+    Upload missing files over a single HTTP/2 client using a pool of worker coroutines.
+
+    A bounded queue feeds the workers, so the number of pending uploads stays
+    constant no matter how many files are missing. `missing_files` is consumed
+    lazily, so uploads start while a generator such as `iter_missing_ids` is
+    still reading its input.
+
+    Args:
+        missing_files (iterable): Missing file IDs.
+        directory_path (str): Path to the local directory containing the files.
+        bucket (str): Name of the Supabase bucket.
+        bucket_dir (str): Directory path in the bucket to upload files to.
+        file_extension (str): Extension of the files to upload.
+        concurrency (int): Maximum number of uploads in flight at once.
+        valid_files (set): Filenames already present and non-empty in the bucket.
+    """
+    queue = asyncio.Queue(maxsize=concurrency * 4)
+    to_upload = _select_uploads(missing_files, directory_path, file_extension, valid_files)
+    processed = 0
+    uploaded = 0
+
+    async with _async_client({"Content-Type": "application/octet-stream"}) as client:
+
+        async def worker():
+            nonlocal processed, uploaded
+            while True:
+                file_id = await queue.get()
+                try:
+                    if await _upload_one(
+                        client,
+                        file_id,
+                        directory_path,
+                        bucket,
+                        bucket_dir,
+                        file_extension,
+                    ):
+                        uploaded += 1
+                finally:
+                    processed += 1
+                    if processed % PROGRESS_INTERVAL == 0:
+                        logger.info("Processed %d uploads.", processed)
+                        _flush_logs()
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            while True:
+                # Pull the next batch in a worker thread, so parsing a CSV chunk
+                # inside a lazy `missing_files` does not stall in-flight uploads
+                batch, error = await asyncio.to_thread(_next_batch, to_upload, queue.maxsize)
+                for file_id in batch:
+                    await queue.put(file_id)
+                if error is not None:
+                    logger.error("Error reading missing file IDs: %s", error)
+                    break
+                if not batch:
+                    break
+
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    logger.info("Uploaded %d of %d files.", uploaded, processed)
+    _flush_logs()
+
+
+def upload_missing_files(
+    missing_files,
+    directory_path,
+    bucket,
+    bucket_dir,
+    file_extension,
+    concurrency=16,
+    valid_files=None,
+):
+    """
+    Upload missing files to Supabase storage.
+
+    Args:
+        missing_files (iterable): Missing file IDs, e.g. a list or `iter_missing_ids(...)`.
+        directory_path (str): Path to the local directory containing the files.
+        bucket (str): Name of the Supabase bucket.
+        bucket_dir (str): Directory path in the bucket to upload files to.
+        file_extension (str): Extension of the files to upload.
+        concurrency (int): Maximum number of uploads in flight at once.
+        valid_files (set): Filenames already present and non-empty in the bucket,
+            which are skipped even if listed as missing.
+    """
+    asyncio.run(
+        _upload_missing_files_async(
+            missing_files,
+            directory_path,
+            bucket,
+            bucket_dir,
+            file_extension,
+            concurrency,
+            valid_files or set(),
+        )
+    )
+
+
+def iter_missing_ids(csv_path, file_list, zero_byte_list, file_extension, chunksize=100000):
+    """
+    Lazily yield the IDs in a CSV file that have no valid file in the bucket.
+
+    The CSV is read in chunks, so only one chunk of IDs is held in memory and
+    consumers such as `upload_missing_files` can start before the file is fully read.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+        file_list (set): Set of filenames fetched from the bucket.
+        zero_byte_list (set): Set of filenames that have 0 byte size.
+        file_extension (str): Extension of the files in the bucket.
+        chunksize (int): Number of CSV rows read per chunk.
+
+    Yields:
+        str: IDs that do not have corresponding files in the bucket.
+    """
+    # Strip the extension from the valid bucket files once so the CSV IDs
+    # can be compared directly, without building a filename per row
+    suffix = f".{file_extension}"
+    slen = len(suffix)
+    valid_ids = {name[:-slen] for name in file_list - zero_byte_list if name.endswith(suffix)}
+
+    reader = pd.read_csv(
+        csv_path,
+        usecols=["id"],
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8-sig",
+        chunksize=chunksize,
+    )
+    with reader:
+        for chunk in reader:
+            ids = chunk["id"]
+            ids = ids[ids != ""]
+            yield from ids[~ids.isin(valid_ids)]
 
 
 def get_missing_files_from_csv(csv_path, file_list, zero_byte_list, file_extension):
@@ -145,23 +633,16 @@ def get_missing_files_from_csv(csv_path, file_list, zero_byte_list, file_extensi
     missing_ids = []
 
     try:
-        with open(csv_path, mode="r", encoding="utf-8-sig") as csvfile:
-            csvreader = csv.DictReader(csvfile)
-            for row in csvreader:
-                id_value = row.get("id")
-                if not id_value:
-                    continue
-
-                file_name = f"{id_value}.{file_extension}"
-                if not is_file_valid(file_name, file_list, zero_byte_list):
-                    missing_ids.append(id_value)
+        missing_ids = list(iter_missing_ids(csv_path, file_list, zero_byte_list, file_extension))
     except Exception as e:
-        print(f"Error reading CSV file: {e}")
+        logger.error("Error reading CSV file: %s", e)
 
     return missing_ids
 
 
-def delete_missing_ids_from_database(missing_ids, table_name, column_name, supabase_client):
+def delete_missing_ids_from_database(
+    missing_ids, table_name, column_name, supabase_client, chunk_size=1000, max_workers=8
+):
     """
     Deletes rows from the database where the specified column matches the IDs in missing_ids.
 
@@ -169,22 +650,51 @@ def delete_missing_ids_from_database(missing_ids, table_name, column_name, supab
     :param table_name: Name of the database table.
     :param column_name: Column name to match the IDs against.
     :param supabase_client: Initialized Supabase client.
+    :param chunk_size: Number of IDs matched per delete request.
+    :param max_workers: Maximum number of delete requests in flight at once.
     """
-    try:
-        response = (
+
+    def delete_chunk(chunk):
+        return (
             supabase_client.table(table_name)
             .delete()
-            .in_(column_name, missing_ids)
+            .in_(column_name, chunk)
             .eq("source", "archive_of_our_own")  # Additional condition
             .execute()
         )
-        print(f"Removed IDs from the database. Response: {response}")
 
-    except Exception as e:
-        print(f"An error occurred while removing data from the database: {e}")
+    # Keep each IN list small enough for the URL and the query planner
+    chunks = [missing_ids[i : i + chunk_size] for i in range(0, len(missing_ids), chunk_size)]
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(chunk, executor.submit(delete_chunk, chunk)) for chunk in chunks]
+        for chunk, future in futures:
+            try:
+                response = future.result()
+                logger.info("Removed %d IDs from the database. Response: %s", len(chunk), response)
+            except Exception as e:
+                logger.error(
+                    "An error occurred while removing IDs %s from the database: %s", chunk, e
+                )
+                failed.extend(chunk)
+
+    if failed:
+        logger.error("%d IDs could not be removed from the database.", len(failed))
+    else:
+        logger.info("Removed all %d IDs from the database.", len(missing_ids))
 
 
 if __name__ == "__main__":
+    # Hold log records back until an error, a progress line or a prompt flushes
+    # them, so output arrives in blocks rather than interleaved with the prompts
+    log_handler = logging.handlers.MemoryHandler(
+        capacity=1000, flushLevel=logging.ERROR, target=logging.StreamHandler()
+    )
+    logging.basicConfig(level=logging.INFO, handlers=[log_handler])
+    # httpx logs every request at INFO, which would bring back one line per upload
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     bucket = "fictionpress"
     bucket_dir = "contents"
     # Specify the path to your CSV file
@@ -192,8 +702,13 @@ if __name__ == "__main__":
 
     file_extension = "txt"
 
+    # Pass --refresh to ignore the cached bucket listing
+    refresh = "--refresh" in sys.argv[1:]
+
     # Fetch the list of files in the bucket
-    bucket_file_list, zero_byte_file_list = fetch_file_list_from_bucket(bucket, bucket_dir)
+    bucket_file_list, zero_byte_file_list = fetch_file_list_from_bucket(
+        bucket, bucket_dir, refresh=refresh
+    )
 
     if bucket_file_list is None:
         print("Could not fetch bucket file list. Exiting.")
@@ -204,11 +719,13 @@ if __name__ == "__main__":
         csv_file_path, bucket_file_list, zero_byte_file_list, file_extension
     )
 
+    # Flush buffered logs before printing results and prompting the user
+    log_handler.flush()
+
     # Print IDs that do not have a corresponding file
     if missing_file_ids:
         print("IDs with no corresponding file in the bucket:")
-        for id_ in missing_file_ids:
-            print(id_)
+        print("\n".join(missing_file_ids))
 
         print("missing file count", len(missing_file_ids))
         # Prompt user for action
@@ -222,15 +739,51 @@ if __name__ == "__main__":
             retry_directory = input("Enter the directory path to retry uploading from: ").strip()
 
             if os.path.isdir(retry_directory):
+                # Re-list the bucket so files uploaded since the first listing,
+                # e.g. by another run, are skipped instead of uploaded again
+                fresh_file_list, fresh_zero_byte_list = fetch_file_list_from_bucket(
+                    bucket, bucket_dir, refresh=True
+                )
                 upload_missing_files(
-                    missing_file_ids, retry_directory, bucket, bucket_dir, file_extension
+                    missing_file_ids,
+                    retry_directory,
+                    bucket,
+                    bucket_dir,
+                    file_extension,
+                    valid_files=(
+                        fresh_file_list - fresh_zero_byte_list
+                        if fresh_file_list is not None
+                        else None
+                    ),
                 )
+                # The bucket has changed, so the cached listing is stale
+                clear_cached_file_list(bucket, bucket_dir)
             else:
                 print(f"Invalid directory path: {retry_directory}")
         elif choice == "2":
             table_name = input("Enter the table name: ").strip()
             column_name = input("Enter the column name: ").strip()
-            delete_missing_ids_from_database(missing_file_ids, table_name, column_name, supabase)
+
+            # Re-list the bucket so files uploaded since the listing was cached
+            # do not get their rows deleted
+            fresh_file_list, fresh_zero_byte_list = fetch_file_list_from_bucket(
+                bucket, bucket_dir, refresh=True
+            )
+            if fresh_file_list is None:
+                log_handler.flush()
+                print("Could not refresh bucket file list. Nothing was deleted.")
+            else:
+                still_missing = set(
+                    get_missing_files_from_csv(
+                        csv_file_path, fresh_file_list, fresh_zero_byte_list, file_extension
+                    )
+                )
+                delete_missing_ids_from_database(
+                    [id_ for id_ in missing_file_ids if id_ in still_missing],
+                    table_name,
+                    column_name,
+                    supabase,
+                )
         else:
             print("No retry selected. Exiting.")
     else: